@@ -1,9 +1,26 @@
 # -*- coding: utf-8 -*-
 """Class used to generate formatted markdown tables. See class description"""
-import math
-from typing import Optional, List, Dict, Union
+import heapq
+import json
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor
+from itertools import repeat
+from operator import attrgetter
+from typing import Optional, List, Dict, Iterable, Union
 from py_markdown_table.utils import count_emojis, split_list_by_indices
 
+# bounds of the per-column cache of rendered cells, see markdown_table.__get_normal_row
+_CELL_CACHE_SIZE = 256
+_CELL_CACHE_MAX_MISSES = 4 * _CELL_CACHE_SIZE
+# tables with fewer rows are rendered without the cache, as they repeat too few cells to make up for setting it up
+_CELL_CACHE_MIN_ROWS = 16
+
+# rendering parameters stored in a layout next to the column widths, see markdown_table.get_layout
+_LAYOUT_PARAMS = [
+    "row_sep", "padding_width", "padding_weight", "padding_char", "newline_char", "quote",
+    "emoji_spacing", "float_rounding", "multiline", "multiline_strategy", "multiline_delimiter",
+]
+
 
 class markdown_table:  # noqa: N801
     """
@@ -17,12 +34,24 @@ class markdown_table:  # noqa: N801
         gets unescaped table header
     get_body()
         gets unescaped table content
+    stream_markdown()
+        yields complete escaped markdown table in chunks
+    estimate_size()
+        gets the size of the complete markdown table without rendering it
+    get_layout()
+        gets the column widths and rendering parameters of the table
+    save_layout()
+        saves the layout of the table as a JSON file
+    column_pages()
+        yields the table split into slices of columns fitting a maximum width
     """
 
     def __init__(
         self, 
         data: Union[List[Dict], Dict],
         skip_data_validation: bool = False,
+        layout: Optional[Union[Dict, str]] = None,
+        strict_layout: bool = False,
     ):
         """
         Initialize markdown_table with support for various rendering parameters.
@@ -31,12 +60,13 @@ class markdown_table:  # noqa: N801
         `data` (List[Dict]): The data to be rendered in the markdown table. \n
         `skip_data_validation` (bool, optional): skip the data validation step before rending a table. Useful when renderers change the length of a string (i.e. markdown urls). \n
             Default is `False` \n
+        `layout` (Union[Dict, str], optional): A layout returned by `get_layout()` or the path of a JSON file written by `save_layout()`. The table is rendered with the parameters and column widths of the layout without scanning the data for its widths. Columns which the data does not fit into are widened and the table is rendered again. Calling `set_params()` discards the layout.
+            Default is `None` \n
+        `strict_layout` (bool, optional): Raise a `ValueError` instead of widening the layout when the data does not fit into it.
+            Default is `False` \n
 
         """
-        if not isinstance(data, list) or not all(isinstance(elem, dict) for elem in data):
-            raise ValueError("data is not of type list or elements are not of type dict")
-        if len(data) == 0:
-            raise ValueError("Data variable contains no elements.")
+        self.__check_data_type(data)
         self.data = data
 
         # set defaults
@@ -50,21 +80,143 @@ class markdown_table:  # noqa: N801
         self.multiline = None
         self.multiline_strategy = "rows"
         self.multiline_delimiter = " "
+        self.fit_width = None
         self.quote = True
+        self.max_rows = None
+        self.max_output_chars = None
+        self.budget_widths = "all"
+        self.style = "padded"
+        self.numeric_alignment = None
+        self.sort_by = None
+        self.sort_order = "descending"
+        self.limit = None
         self.skip_data_validation = skip_data_validation
+        self.layout = None
+        self.strict_layout = strict_layout
+        # rows which are left out of `data` but counted in the omitted rows footer, see column_pages()
+        self.omitted_rows = 0
+
+        if layout is not None:
+            self.__set_layout(layout)
 
         self.__validate_parameters()
         
         if not self.skip_data_validation:
             self.__validate_data(data)
 
-        self.__update_meta_params()
+        # the widths are computed once the parameters are final, i.e. by set_params() or when rendering,
+        # so that they are neither computed for unselected rows nor for styles which don't need them
+        self.var_rows = None
 
-        # we need to first update the meta_params for cell width, padding etc
-        # prior to checking whether the data will fit for multiline rendering
-        if self.multiline:
-            self.__validate_multiline(self.data)
-        
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size: int = 1000):
+        """
+        Create a markdown_table from the result set of a DB-API 2.0 cursor (e.g. `sqlite3`) after a query has been executed.
+
+        Args:
+        `cursor`: The cursor to read from. Column names are taken from `cursor.description` and have to be unique, e.g. by aliasing the columns of joined tables. \n
+        `batch_size` (int, optional): Number of rows fetched at once with `cursor.fetchmany()`.
+            Default is `1000`. \n
+
+        Returns:
+            markdown_table: The table, with data validation skipped as all rows share the cursor's columns.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size value of '{batch_size}' is not valid. Please use a positive integer.")
+        if cursor.description is None:
+            raise ValueError("cursor has no result set. Please execute a query returning rows first.")
+        columns = [column[0] for column in cursor.description]
+        # e.g. the `id` columns of joined tables, which have to be aliased in the query
+        cls.__check_unique_columns(columns, "cursor.description")
+        data = []
+        rows = cursor.fetchmany(batch_size)
+        while rows:
+            data.extend(map(dict, map(zip, repeat(columns), rows)))
+            rows = cursor.fetchmany(batch_size)
+        return cls(data, skip_data_validation=True)
+
+    @classmethod
+    def from_objects(cls, objs: Iterable, fields: List[str]):
+        """
+        Create a markdown_table from objects such as dataclasses or namedtuples, reading `fields` as attributes.
+
+        Args:
+        `objs` (Iterable): The objects to be rendered, one per row. \n
+        `fields` (List[str]): The attributes to be rendered as columns, in order. Each attribute can only be given once. \n
+
+        Returns:
+            markdown_table: The table, with data validation skipped as all rows share the same columns.
+        """
+        if not fields:
+            raise ValueError("fields contains no elements.")
+        fields = list(fields)
+        cls.__check_unique_columns(fields, "fields")
+        getter = attrgetter(*fields)
+        values = map(getter, objs)
+        if len(fields) == 1:
+            # attrgetter returns a single value instead of a tuple for one attribute
+            values = zip(values)
+        return cls(list(map(dict, map(zip, repeat(fields), values))), skip_data_validation=True)
+
+    @classmethod
+    def _render(cls, data, params, skip_data_validation=False):
+        """Render `data` with parameters previously validated by set_params() on a table with the same columns.
+        The output is identical to `markdown_table(data).set_params(...).get_markdown()` while skipping
+        parameter validation and the padding scans performed by __init__ and set_params."""
+        cls.__check_data_type(data)
+        table = cls.__new__(cls)
+        table.__dict__.update(params)
+        table.data = data
+        table.skip_data_validation = skip_data_validation
+        if not skip_data_validation:
+            table.__validate_data(data)
+        if table.multiline:
+            # set_params() offsets the multiline widths once before get_markdown() does it again
+            table.multiline = dict(table.multiline)
+            table.__update_meta_params()
+            table.__validate_multiline(table.var_rows)
+        return table.get_markdown()
+
+    @classmethod
+    def _get_layout(cls, data, params, skip_data_validation=False):
+        """Get the layout of `data` with parameters previously validated by set_params() on a table with the same columns,
+        scanning the data once"""
+        cls.__check_data_type(data)
+        if set(data[0].keys()) != set(params["padding_width"].keys()):
+            raise ValueError("Dictionary keys are not uniform across datasets.")
+        table = cls.__new__(cls)
+        table.__dict__.update(params)
+        table.data = data
+        table.skip_data_validation = skip_data_validation
+        if not skip_data_validation:
+            table.__validate_data(data)
+        if table.multiline:
+            table.multiline = dict(table.multiline)
+        table.__update_meta_params()
+        if table.multiline:
+            table.__validate_multiline(table.var_rows)
+        return table.get_layout()
+
+    def __set_layout(self, layout):
+        """Take over the column widths and rendering parameters of a layout"""
+        if not isinstance(layout, dict):
+            with open(layout, encoding="utf-8") as file:
+                layout = json.load(file)
+        missing = [key for key in ["widths"] + _LAYOUT_PARAMS if key not in layout]
+        if missing:
+            raise ValueError(f"layout is missing the values {missing}.")
+        keys = set(self.data[0].keys())
+        for attr in ["widths", "padding_width", "padding_weight"]:
+            if not isinstance(layout[attr], dict) or set(layout[attr].keys()) != keys:
+                raise ValueError(f"layout {attr} columns do not match the columns of the data {list(self.data[0].keys())}.")
+        for key, value in layout["widths"].items():
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f"layout widths[{key}] value of '{value}' is not valid. Please use a non-negative integer.")
+        for attr in _LAYOUT_PARAMS:
+            value = layout[attr]
+            setattr(self, attr, dict(value) if isinstance(value, dict) else value)
+        self.layout = dict(layout["widths"])
 
     def set_params(
         self,
@@ -78,7 +230,16 @@ class markdown_table:  # noqa: N801
         multiline: Optional[Dict] = None,
         multiline_strategy: str = "rows",
         multiline_delimiter: str = " ",
+        fit_width: Optional[int] = None,
         quote: bool = True,
+        max_rows: Optional[int] = None,
+        max_output_chars: Optional[int] = None,
+        budget_widths: str = "all",
+        style: str = "padded",
+        numeric_alignment: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "descending",
+        limit: Optional[int] = None,
     ):
         """
         Setter function for markdown table rendering parameters.
@@ -113,12 +274,41 @@ class markdown_table:  # noqa: N801
             Default is `rows`. \n
         `multiline_delimiter` (str, optional): Character that will be used to split a cell's contents into multiple rows.
             Default is a blank space ` `. \n
+        `fit_width` (int, optional): Renders the table as `multiline` with column widths chosen automatically so that the table fits within `fit_width` characters, while minimizing the number of rendered lines. A column is never narrower than its longest contiguous string. The chosen widths are stored in `multiline`.
+            Default is `None`. \n
         `quote` (bool, optional): Wraps the generated markdown table in block quotes ` ```table``` `. 
-            Default is `True`.
+            Default is `True`. \n
+        `max_rows` (int, optional): Maximum number of rows rendered by `get_markdown()`. Omitted rows are summarized in a `N more rows omitted` footer.
+            Default is `None`. \n
+        `max_output_chars` (int, optional): Maximum number of characters returned by `get_markdown()`. Rendering stops before the first row which would exceed the budget and the table is closed with a `N more rows omitted` footer. The header, bottom separator and quotes are always rendered.
+            Default is `None`. \n
+        `budget_widths` (str, optional): Rows used to compute column widths when `max_rows` or `max_output_chars` is set. Possible values are:
+            `all`: Widths are computed from all rows.
+            `shown`: Widths are computed only from the rows which are rendered. Has no effect on `multiline` tables.
+            Default is `all`. \n
+        `style` (str, optional): Output style of the table. Possible values are:
+            `padded`: Renders padded and aligned columns.
+            `gfm-compact`: Renders an unpadded GitHub-flavored markdown pipe table with alignment markers derived from `padding_weight`. Pipes and backslashes in cells are escaped and newlines are replaced with `<br>`. No column widths are computed, `row_sep` and `quote` are ignored and `multiline` is not supported.
+            Default is `padded`. \n
+        `numeric_alignment` (str, optional): Renders columns containing only `int` and `float` values through a numeric fast path, formatting the whole column at once. Floats are formatted with a fixed precision of `float_rounding` digits when it is set. Possible values are:
+            `right`: Aligns the numbers to the end of the cell.
+            `decimal`: Aligns the numbers on their decimal point.
+            `None`: Numeric columns are rendered like any other column.
+            Not supported by `multiline` tables and the `gfm-compact` style. Default is `None`. \n
+        `sort_by` (str, optional): Column by which the rows are ordered before rendering. Missing values (`None`) are placed last. The input data is not modified.
+            Default is `None`. \n
+        `sort_order` (str, optional): Order applied when `sort_by` is set. Possible values are:
+            `descending`: Rows with the largest values come first.
+            `ascending`: Rows with the smallest values come first.
+            Default is `descending`. \n
+        `limit` (int, optional): Number of rows selected for rendering. Combined with `sort_by` it renders the top-N rows, which are selected with a partial heap sort instead of sorting all rows. Column widths are computed only from the selected rows.
+            Default is `None`.
 
         Returns:
             self: Returns the instance with updated parameters.
         """
+        # the widths are computed from the data again
+        self.layout = None
         self.row_sep = row_sep
         self.padding_width = padding_width
         self.padding_weight = padding_weight
@@ -129,7 +319,16 @@ class markdown_table:  # noqa: N801
         self.multiline = multiline
         self.multiline_strategy = multiline_strategy
         self.multiline_delimiter = multiline_delimiter
+        self.fit_width = fit_width
         self.quote = quote
+        self.max_rows = max_rows
+        self.max_output_chars = max_output_chars
+        self.budget_widths = budget_widths
+        self.style = style
+        self.numeric_alignment = numeric_alignment
+        self.sort_by = sort_by
+        self.sort_order = sort_order
+        self.limit = limit
         
         if isinstance(padding_width, int):
             self.padding_width = {key: padding_width for key in self.data[0].keys()}
@@ -145,28 +344,63 @@ class markdown_table:  # noqa: N801
         self.__update_meta_params()
         
         if self.multiline:
-            self.__validate_multiline(self.data)
+            self.__validate_multiline(self.var_rows)
 
         return self
 
     def __update_meta_params(self):
         """Update and store internal meta-parameters"""
-        if self.multiline:
+        self.var_rows = self.__get_rows()
+        # columns with cells which do not fit into the widths of a layout
+        self.var_overflow = set()
+        # set_params() adds padding_width to the multiline widths and get_markdown() adds it once more,
+        # so the widths are only final once the table is rendered
+        self.var_multiline_pending = bool(self.multiline) and not self.fit_width and self.layout is None
+        if self.style == "gfm-compact":
+            # compact tables are not padded, so the data does not need to be scanned
+            return
+        if self.layout is not None:
+            # the widths of a layout are used as they are, without any knowledge of the contents,
+            # in the column order of the data
+            self.var_padding = {key: self.layout[key] for key in self.data[0].keys()}
+            self.var_profile = {
+                key: {"ascii": False, "numeric": False, "newlines": True, "max_length": 0, "emojis": 0, "max_token": 0, "line_lengths": None}
+                for key in self.data[0].keys()
+            }
+            self.var_numeric = {}
+            self.__round_floats(self.var_rows)
+        elif self.multiline or self.fit_width:
+            self.var_profile = self.__get_padding(self.var_rows)[1]
+            self.var_numeric = {}
+            if self.fit_width:
+                self.multiline = self.__get_fitted_widths()
             self.var_padding = self.multiline
             # add user-defined padding to the provided multiline column width dict
             for key, value in self.var_padding.items():
                 self.var_padding[key] = value + self.padding_width[key]
+        elif self.budget_widths == "shown" and self.max_rows is not None:
+            self.var_padding, self.var_profile, self.var_numeric = self.__get_padding(self.var_rows[:self.max_rows])
         else:
-            self.var_padding = self.__get_padding()
+            self.var_padding, self.var_profile, self.var_numeric = self.__get_padding(self.var_rows)
+        self.__reset_cell_cache()
+        # columns with cells which may have to be split in multiple lines
+        self.var_multiline_columns = [
+            key for key, profile in self.var_profile.items()
+            if profile["newlines"] or profile["max_length"] + self.__get_split_emojis(profile) > self.var_padding[key]
+        ]
         self.var_row_sep = self.__get_row_sep_str()
         # self.var_row_sep_last = self.__get_row_sep_last()
-        self.var_row_sep_last = self.__get_row_sep_str()
+        self.var_row_sep_last = self.var_row_sep
 
     def __validate_parameters(self): # noqa: C901
         valid_values = {
             "row_sep": ["always", "topbottom", "markdown", None],
             "emoji_spacing": ["mono", None],
-            "multiline_strategy": ["rows", "header", "rows_and_header"]
+            "multiline_strategy": ["rows", "header", "rows_and_header"],
+            "budget_widths": ["all", "shown"],
+            "sort_order": ["descending", "ascending"],
+            "style": ["padded", "gfm-compact"],
+            "numeric_alignment": ["right", "decimal", None],
         }
 
         valid_dict_values = {
@@ -206,6 +440,17 @@ class markdown_table:  # noqa: N801
         if not isinstance(self.multiline, (type(None), dict)):
             raise ValueError(f"multiline value of '{self.multiline}' is not valid. Please use a dict or leave as None.")
 
+        # Validate fit_width
+        if self.fit_width is not None and (not isinstance(self.fit_width, int) or self.fit_width < 1):
+            raise ValueError(f"fit_width value of '{self.fit_width}' is not valid. Please use a positive integer or leave as None.")
+        if self.fit_width is not None and self.multiline:
+            raise ValueError("fit_width and multiline cannot be used together.")
+
+        if (self.multiline or self.fit_width) and self.style != "padded":
+            raise ValueError(f"multiline is not supported by the '{self.style}' style.")
+        if self.numeric_alignment and (self.multiline or self.fit_width or self.style != "padded"):
+            raise ValueError("numeric_alignment is only supported by padded tables without multiline.")
+
         # Validate multiline_delimiter
         if not isinstance(self.multiline_delimiter, str) or len(self.multiline_delimiter) != 1:
             raise ValueError(f"multiline_delimiter value of '{self.multiline_delimiter}' is not valid. Please use a single character string.")
@@ -214,6 +459,36 @@ class markdown_table:  # noqa: N801
         if not isinstance(self.quote, bool):
             raise ValueError(f"quote value of '{self.quote}' is not valid. Please use a boolean.")
 
+        # Validate strict_layout
+        if not isinstance(self.strict_layout, bool):
+            raise ValueError(f"strict_layout value of '{self.strict_layout}' is not valid. Please use a boolean.")
+
+        # Validate output budget
+        for attr in ["max_rows", "max_output_chars"]:
+            value = getattr(self, attr)
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise ValueError(f"{attr} value of '{value}' is not valid. Please use a non-negative integer or leave as None.")
+
+        # Validate row selection
+        if self.sort_by is not None and self.sort_by not in self.data[0]:
+            raise ValueError(f"sort_by value of '{self.sort_by}' is not valid. Possible values are {list(self.data[0].keys())}.")
+        if self.limit is not None and (not isinstance(self.limit, int) or self.limit < 1):
+            raise ValueError(f"limit value of '{self.limit}' is not valid. Please use a positive integer or leave as None.")
+
+    @staticmethod
+    def __check_data_type(data):
+        if not isinstance(data, list) or not all(isinstance(elem, dict) for elem in data):
+            raise ValueError("data is not of type list or elements are not of type dict")
+        if len(data) == 0:
+            raise ValueError("Data variable contains no elements.")
+
+    @staticmethod
+    def __check_unique_columns(columns, source):
+        # dict keys are unique, so the values of repeated columns would overwrite each other
+        duplicates = [column for column, count in Counter(columns).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"{source} contains duplicated columns {duplicates}. Please use unique column names.")
+
     def __validate_data(self, data):
         # Check if all dictionaries in self.data have uniform keys
         keys = set(data[0].keys())
@@ -224,6 +499,16 @@ class markdown_table:  # noqa: N801
                 raise ValueError("Dictionary keys are not uniform across data variable.")
 
     def __validate_multiline(self, data):
+        for key in self.data[0].keys():
+            if key not in self.var_padding:
+                raise KeyError(f"Key '{key}' not found in var_padding.")
+        # the column profiles hold the longest contiguous string of each column,
+        # so rows only need to be scanned to report which element is too long
+        if all(
+            self.var_profile[key]["max_token"] + self.padding_width[key] <= self.var_padding[key]
+            for key in self.data[0].keys()
+        ):
+            return
         for i, row in enumerate(data):
             for key in row.keys():
                 if key in self.var_padding:
@@ -241,26 +526,197 @@ class markdown_table:  # noqa: N801
                 else:
                     raise KeyError(f"Key '{key}' not found in var_padding.")
 
-    def __get_padding(self):
-        """Calculate table-wide padding."""
+    def __get_rows(self):
+        """Select the rows to be rendered based on `sort_by` and `limit`."""
+        if self.sort_by is None:
+            return self.data if self.limit is None else self.data[:self.limit]
+        column = self.sort_by
+        descending = self.sort_order == "descending"
+        # missing values (e.g. SQL NULLs) come last in both orders
+        if descending:
+            def key(item):
+                return item[column] is not None, item[column]
+        else:
+            def key(item):
+                return item[column] is None, item[column]
+        try:
+            if self.limit is None:
+                return sorted(self.data, key=key, reverse=descending)
+            # partial selection is O(n log k) and is equivalent to sorted(...)[:limit]
+            if descending:
+                return heapq.nlargest(self.limit, self.data, key=key)
+            return heapq.nsmallest(self.limit, self.data, key=key)
+        except TypeError as error:
+            raise ValueError(f"sort_by column '{column}' contains values which cannot be compared: {error}") from error
+
+    def __round_floats(self, data):
+        """Round the floats of `data` in place, as done while computing the padding"""
+        if not self.float_rounding:
+            return
+        for item in data:
+            for key, value in item.items():
+                if isinstance(value, float):
+                    item[key] = round(value, self.float_rounding)
+
+    def __get_padding(self, data):  # noqa: C901
+        """Calculate table-wide padding and profile the contents of each column in a single pass per column.
+        Columns rendered through the numeric fast path are returned as fully padded cells."""
         padding = {}
-        for item in self.data[0].keys():
-            padding[item] = len(item)
-        for item in self.data:
-            for key in item.keys():
-                if self.float_rounding and isinstance(item[key], float):
-                    item[key] = round(item[key], self.float_rounding)
-                # prepend float pre-processing
-                if (padding[key] - self.padding_width[key]) < len(str(item[key])):
-                    padding[key] = len(str(item[key])) + self.padding_width[key]
-                # prepend emoji pre-processing
-                emoji = []
-                if self.emoji_spacing == "mono":
-                    emoji = count_emojis(item[key])
-                # adapt padding with all information
-                if padding[key] - self.padding_width[key] - len(emoji) < len(str(item[key])):
-                    padding[key] = len(str(item[key])) + self.padding_width[key] + len(emoji)
-        return padding
+        profile = {}
+        numeric_cells = {}
+        mono = self.emoji_spacing == "mono"
+        float_rounding = self.float_rounding
+        # token and line lengths are only needed to wrap multiline tables
+        delimiter = self.multiline_delimiter if self.multiline or self.fit_width else None
+        # rows which are not wrapped count as a single line
+        split_lines = self.multiline_strategy != "header"
+        for key in self.data[0].keys():
+            texts = None
+            if self.numeric_alignment:
+                values = [item[key] for item in data]
+                if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+                    texts = self.__format_numeric(values)
+            numeric = True
+            ascii_only = True
+            newlines = False
+            max_length = max_width = emojis = max_token = 0
+            # only needed to fit the table into `fit_width`
+            line_lengths = Counter() if self.fit_width else None
+            for index, item in enumerate(data):
+                if texts is None:
+                    value = item[key]
+                    if float_rounding and isinstance(value, float):
+                        value = item[key] = round(value, float_rounding)
+                    if numeric and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                        numeric = False
+                    text = str(value)
+                else:
+                    text = texts[index]
+                length = len(text)
+                if length > max_length:
+                    max_length = length
+                # emojis can only be present in cells which are not pure ascii
+                if not text.isascii():
+                    ascii_only = False
+                    if mono:
+                        extra = len(count_emojis(text))
+                        emojis += extra
+                        max_width = max(max_width, length + extra)
+                if "\n" in text:
+                    newlines = True
+                if delimiter is None:
+                    continue
+                max_token = max(max_token, max(map(len, text.split(delimiter))))
+                if line_lengths is None:
+                    continue
+                if not split_lines:
+                    line_lengths[length + (len(count_emojis(text)) if mono and not text.isascii() else 0)] += 1
+                    continue
+                for line in text.split("\n"):
+                    line_lengths[len(line) + (len(count_emojis(line)) if mono and not line.isascii() else 0)] += 1
+            max_width = max(max_width, max_length)
+            padding[key] = max(len(key), max_width + self.padding_width[key])
+            if texts is not None:
+                numeric_cells[key] = [text.rjust(padding[key], self.padding_char) for text in texts]
+            profile[key] = {
+                # the header and padding character are also rendered through the cell functions
+                "ascii": ascii_only and key.isascii() and self.padding_char.isascii(),
+                "numeric": numeric,
+                "newlines": newlines,
+                "max_length": max_length,
+                # extra characters taken up by emojis with `emoji_spacing="mono"`
+                "emojis": emojis,
+                "max_token": max_token,
+                # widths of the lines into which the cells are wrapped, or of the whole cells if rows are not wrapped
+                "line_lengths": line_lengths,
+            }
+        return padding, profile, numeric_cells
+
+    def __get_fitted_widths(self):  # noqa: C901
+        """Choose multiline column widths fitting the table into `fit_width` characters. Starting from the
+        narrowest valid widths, the remaining space is handed out greedily to the column whose estimated
+        number of lines, derived from the line length histogram of its profile, drops the most per character."""
+        keys = list(self.data[0].keys())
+        wrap_header = self.multiline_strategy in ["header", "rows_and_header"]
+        wrap_rows = self.multiline_strategy in ["rows", "rows_and_header"]
+        widths = {}
+        histograms = {}
+        for key in keys:
+            profile = self.var_profile[key]
+            if wrap_rows:
+                histograms[key] = Counter(profile["line_lengths"])
+                widths[key] = profile["max_token"]
+            else:
+                # cells which are not wrapped need the full width of the longest one
+                histograms[key] = Counter()
+                widths[key] = max(profile["line_lengths"], default=0)
+            if wrap_header:
+                histograms[key][len(key)] += 1
+                widths[key] = max([widths[key]] + [len(token) for token in key.split(self.multiline_delimiter)])
+            else:
+                widths[key] = max(widths[key], len(key))
+            widths[key] = max(widths[key], 1)
+            if not profile["ascii"]:
+                # emojis take up an extra character when cells are split
+                texts = ([str(item[key]) for item in self.var_rows] if wrap_rows else []) + ([key] if wrap_header else [])
+                widths[key] = max([widths[key]] + [
+                    len(token) + len(count_emojis(token))
+                    for text in texts for token in text.replace("\n", self.multiline_delimiter).split(self.multiline_delimiter)
+                ])
+
+        slack = self.fit_width - sum(widths[key] + self.padding_width[key] for key in keys) - len(keys) - 1
+        if slack < 0:
+            raise ValueError(
+                f"fit_width value of '{self.fit_width}' is too small. "
+                f"The table needs at least {self.fit_width - slack} characters."
+            )
+
+        def lines(key, width):
+            return sum(count * -(-length // width) for length, count in histograms[key].items())
+
+        while slack:
+            best = None
+            for key in keys:
+                width = widths[key]
+                # the next width at which any of the lines needs one line less
+                targets = [-(-length // (-(-length // width) - 1)) for length in histograms[key] if length > width]
+                if not targets or min(targets) - width > slack:
+                    continue
+                target = min(targets)
+                gain = (lines(key, width) - lines(key, target)) / (target - width)
+                if best is None or gain > best[0]:
+                    best = (gain, key, target)
+            if best is None:
+                break
+            _, key, target = best
+            slack -= target - widths[key]
+            widths[key] = target
+
+        # cells are wrapped on whole words, so spread the remaining space over the wrapped columns
+        wrapped = [key for key in keys if max(histograms[key], default=0) > widths[key]]
+        while slack and wrapped:
+            for key in wrapped[:slack]:
+                widths[key] += 1
+            slack -= len(wrapped[:slack])
+            wrapped = [key for key in wrapped if max(histograms[key]) > widths[key]]
+        return widths
+
+    def __format_numeric(self, values):
+        """Format a numeric column at once, aligning it on the decimal point if requested."""
+        if self.float_rounding is not None:
+            float_format = f"{{:.{self.float_rounding}f}}".format
+            texts = [float_format(value) if isinstance(value, float) else str(value) for value in values]
+        else:
+            texts = list(map(str, values))
+        if self.numeric_alignment == "decimal" and texts:
+            parts = [text.partition(".") for text in texts]
+            integer_width = max(len(integer) for integer, _, _ in parts)
+            fraction_width = max(len(point) + len(fraction) for _, point, fraction in parts)
+            texts = [
+                integer.rjust(integer_width, self.padding_char) + (point + fraction).ljust(fraction_width, self.padding_char)
+                for integer, point, fraction in parts
+            ]
+        return texts
 
     def __get_row_sep_str(self):
         row_sep_str = ""
@@ -271,50 +727,103 @@ class markdown_table:  # noqa: N801
 
     def __get_margin(self, margin, key):
         # get column-specific alignment based on the column key (header)
-        if self.padding_weight[key] == "left":
+        padding_weight = self.padding_weight[key]
+        if padding_weight == "left":
             right = 0
-        elif self.padding_weight[key] == "right":
+        elif padding_weight == "right":
             right = margin
-        elif self.padding_weight[key] == "centerleft":
-            right = math.floor(margin / 2)
-        elif self.padding_weight[key] == "centerright":
-            right = math.ceil(margin / 2)
+        elif padding_weight == "centerright":
+            right = -(-margin // 2)
         else:
-            right = math.floor(margin / 2)
+            right = margin // 2
         return right
 
-    def __get_row(self, item):
+    def __get_row(self, item, index):
         # checking if multiline variable for rows is set
         if self.multiline and self.multiline_strategy in ["rows", "rows_and_header"]:
-            # local check if row needs to be split in multiple lines
-            multiline = False
-            for key in self.data[0].keys():
-                if len(item[key]) > self.var_padding[key]:
-                    multiline = True
-                if "\n" in item[key]:
-                    multiline = True
-
-            if multiline:
+            if self.__is_split_row(item):
                 return self.__get_multiline_row(item)
             return self.__get_normal_row(item)
         # if multiline is not set it's not multiline and return regular row
-        return self.__get_normal_row(item)
+        return self.__get_normal_row(item, index)
+
+    def __get_split_emojis(self, profile):
+        """Get the extra characters taken up by the emojis of a column when deciding whether to split its rows.
+        Only `fit_width` tables count them, so that rows of `multiline` tables are split as they always were."""
+        if not self.fit_width or self.emoji_spacing != "mono":
+            return 0
+        # `emojis` is the total over the column, so this includes all columns which may have to be split
+        return profile["emojis"]
+
+    def __is_split_row(self, item):
+        """Check if a row of a multiline table has to be split in multiple lines"""
+        for key in self.var_multiline_columns:
+            if "\n" in item[key]:
+                return True
+            length = len(item[key])
+            if self.__get_split_emojis(self.var_profile[key]):
+                # emojis take up an extra character
+                length += len(count_emojis(item[key]))
+            if length > self.var_padding[key]:
+                return True
+        return False
+
+    def __reset_cell_cache(self):
+        """Clear the rendered cells, which are only valid for the current column widths"""
+        if len(self.var_rows) < _CELL_CACHE_MIN_ROWS:
+            self.var_cell_cache = None
+            return
+        self.var_cell_cache = {key: OrderedDict() for key in self.data[0].keys()}
+        self.var_cell_cache_misses = dict.fromkeys(self.data[0].keys(), 0)
 
-    def __get_normal_row(self, item):
+    def __get_cell(self, value, key):
+        # preprend emoji pre-processing for cell values
+        text = str(value)
+        # extract column padding to local variable so that if emojis are present
+        # the cell can be rendered with the extra spacing needed
+        local_padding = self.var_padding[key]
+        if self.emoji_spacing == "mono" and not self.var_profile[key]["ascii"]:
+            local_padding -= len(count_emojis(text))
+        margin = local_padding - len(text)
+        if margin < 0 and not self.multiline:
+            self.var_overflow.add(key)
+        right = self.__get_margin(margin, key)
+        return "|" + text.rjust(
+            local_padding - right, self.padding_char
+        ).ljust(local_padding, self.padding_char)
+
+    def __get_normal_row(self, item, index=None):
         row = ""
+        caches = self.var_cell_cache
+        numeric = self.var_numeric if index is not None else None
         for key in self.data[0].keys():
-            # preprend emoji pre-processing for cell values
-            emoji = []
-            if self.emoji_spacing == "mono":
-                emoji = count_emojis(item[key])
-            # extract column padding to local variable so that if emojis are present
-            # the cell can be rendered with the extra spacing needed
-            local_padding = self.var_padding[key] - len(emoji)
-            margin = local_padding - len(str(item[key]))
-            right = self.__get_margin(margin, key)
-            row += "|" + str(item[key]).rjust(
-                local_padding - right, self.padding_char
-            ).ljust(local_padding, self.padding_char)
+            # numeric columns are formatted and padded up front for each row index
+            if numeric and key in numeric:
+                row += "|" + numeric[key][index]
+                continue
+            value = item[key]
+            if caches is None:
+                row += self.__get_cell(value, key)
+                continue
+            cache = caches[key]
+            if cache is None or type(value) is not str:
+                row += self.__get_cell(value, key)
+                continue
+            # low-cardinality columns repeat the same values, which are rendered only once
+            cell = cache.get(value)
+            if cell is not None:
+                cache.move_to_end(value)
+                row += cell
+                continue
+            cell = self.__get_cell(value, key)
+            row += cell
+            cache[value] = cell
+            if len(cache) > _CELL_CACHE_SIZE:
+                cache.popitem(last=False)
+            self.var_cell_cache_misses[key] += 1
+            # stop caching columns with too many distinct values to benefit from it
+            if self.var_cell_cache_misses[key] > _CELL_CACHE_MAX_MISSES:
+                self.var_cell_cache[key] = None
         row += "|"
         return row
 
@@ -322,7 +831,9 @@ class markdown_table:  # noqa: N801
         multiline_items = {}
 
         # Helper function to process each element and split by emojis if present
-        def split_and_process_element(element):
+        def split_and_process_element(element, ascii_only):
+            if ascii_only:
+                return [element]
             emojis = count_emojis(element)
             if not emojis:
                 return [element]
@@ -331,6 +842,7 @@ class markdown_table:  # noqa: N801
 
         # Process each column in the row
         for key in self.data[0].keys():
+            ascii_only = self.var_profile[key]["ascii"]
             multiline_row = []
             # First we split by embedded line breaks in order to correctly
             # render lists and othe markdown elements which depend on newline offset
@@ -338,7 +850,7 @@ class markdown_table:  # noqa: N801
                 fully_split_cell = []
                 # Split cell content by the delimiter and process each part
                 for element in line.split(self.multiline_delimiter):
-                    fully_split_cell.extend(split_and_process_element(element))
+                    fully_split_cell.extend(split_and_process_element(element, ascii_only))
 
                 single_row = []
                 item_prev_length, spacing_between_items = 0, 0
@@ -346,10 +858,16 @@ class markdown_table:  # noqa: N801
                 # Create multiline rows from the split elements
                 while fully_split_cell:
                     current_element = fully_split_cell[0]
-                    item_length = len(current_element) + len(count_emojis(current_element))
+                    item_length = len(current_element)
+                    if not ascii_only:
+                        item_length += len(count_emojis(current_element))
 
                     # Check if the current element fits in the row
-                    if item_length + item_prev_length + spacing_between_items + self.padding_width[key] <= self.var_padding[key]:
+                    fits = item_length + item_prev_length + spacing_between_items + self.padding_width[key] <= self.var_padding[key]
+                    if fits or not single_row:
+                        if not fits:
+                            # only the widths of a layout can be narrower than an element, which gets its own line
+                            self.var_overflow.add(key)
                         item_prev_length += item_length
                         single_row.append(fully_split_cell.pop(0))
                         spacing_between_items = len(single_row)
@@ -379,8 +897,39 @@ class markdown_table:  # noqa: N801
         return rows
 
 
+    @staticmethod
+    def __escape_gfm(text):
+        # backslashes are escaped first, so that a trailing one does not escape the next column delimiter
+        return text.replace("\\", "\\\\").replace("|", "\\|").replace("\n", "<br>")
+
+    def __get_gfm_header(self):
+        """Get the header and alignment row of a compact GitHub-flavored markdown table"""
+        alignment = {"left": "---:", "right": ":---", "centerleft": ":---:", "centerright": ":---:"}
+        keys = self.data[0].keys()
+        header = "|" + "|".join(self.__escape_gfm(key) for key in keys) + "|" + self.newline_char
+        header += "|" + "|".join(alignment[self.padding_weight[key]] for key in keys) + "|" + self.newline_char
+        return header
+
+    def __get_gfm_row(self, item, index):
+        cells = []
+        for key in self.data[0].keys():
+            value = item[key]
+            if self.float_rounding and isinstance(value, float):
+                value = round(value, self.float_rounding)
+            cells.append(self.__escape_gfm(str(value)))
+        return "|" + "|".join(cells) + "|"
+
+    def __ensure_meta_params(self):
+        """Compute the meta-parameters unless they were computed since the table was created"""
+        if self.var_rows is None:
+            self.__update_meta_params()
+
     def get_header(self):
         """Get the header of the markdown table"""
+        self.__ensure_meta_params()
+        if self.style == "gfm-compact":
+            return self.__get_gfm_header()
+
         header = ""
         if self.row_sep in ["topbottom", "always"]:
             header += self.newline_char + self.var_row_sep_last + self.newline_char
@@ -395,6 +944,8 @@ class markdown_table:  # noqa: N801
         else:
             for key in self.data[0].keys():
                 margin = self.var_padding[key] - len(key)
+                if margin < 0 and not self.multiline:
+                    self.var_overflow.add(key)
                 right = self.__get_margin(margin, key)
                 header += "|" + key.rjust(
                     self.var_padding[key] - right, self.padding_char
@@ -409,21 +960,429 @@ class markdown_table:  # noqa: N801
 
     def get_body(self):
         """Get the body of the markdown table"""
-        rows = ""
-        for i, item in enumerate(self.data):
-            rows += self.__get_row(item)
-            if i < len(self.data) - 1:
-                rows += self.newline_char
-            if self.row_sep == "always" and i < len(self.data) - 1:
-                rows += self.var_row_sep + self.newline_char
-            if self.row_sep in ["topbottom", "always"] and i == len(self.data) - 1:
-                rows += self.newline_char + self.var_row_sep_last
-        return rows
+        self.__ensure_meta_params()
+        return "".join(self.__iter_body(len(self.var_rows)))
+
+    def __get_table_end(self, omitted, has_rows):
+        """Get the bottom separator and the omitted rows footer of a truncated table"""
+        end = ""
+        row_sep = self.row_sep if self.style == "padded" else None
+        if row_sep in ["topbottom", "always"] and has_rows:
+            end += self.newline_char + self.var_row_sep_last
+        # without rows the header already ends with a newline (and a separator for `always`)
+        if row_sep == "topbottom" and not has_rows:
+            end += self.var_row_sep_last
+        if omitted:
+            if end or has_rows:
+                end += self.newline_char
+            if self.style == "gfm-compact":
+                # a line following a pipe table continues it, so the footer is separated by a blank line
+                end += self.newline_char
+            end += f"{omitted} more row{'s' if omitted != 1 else ''} omitted"
+        return end
+
+    def __iter_body(self, limit, size=None):
+        """Yield at most `limit` rows followed by the end of the table. If the `size` of the output
+        preceding the body is given, stop before the first row which would exceed `max_output_chars`"""
+        get_row = self.__get_gfm_row if self.style == "gfm-compact" else self.__get_row
+        separated = self.style == "padded" and self.row_sep == "always"
+        budget = self.max_output_chars if size is not None else None
+        shown = 0
+        for item in self.var_rows:
+            if shown == limit:
+                break
+            row = get_row(item, shown)
+            if shown:
+                if separated:
+                    row = self.var_row_sep + self.newline_char + row
+                row = self.newline_char + row
+            if budget is not None:
+                end = self.__get_table_end(len(self.var_rows) + self.omitted_rows - shown - 1, True)
+                if size + len(row) + len(end) > budget:
+                    break
+                size += len(row)
+            yield row
+            shown += 1
+        self.var_rows_shown = shown
+        yield self.__get_table_end(len(self.var_rows) + self.omitted_rows - shown, shown > 0)
+
+    def __get_budget_limit(self):
+        """Get the number of rows allowed by `max_rows`, fitting the widths to the shown rows if requested"""
+        limit = len(self.var_rows) if self.max_rows is None else min(self.max_rows, len(self.var_rows))
+        if (
+            self.budget_widths == "all" or self.max_output_chars is None or self.multiline
+            or self.style != "padded" or self.layout is not None
+        ):
+            return limit
+
+        # the size of a table grows with the number of rows used to compute its widths,
+        # so the largest prefix that fits within the budget can be found by bisection
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            self.var_padding, self.var_profile, self.var_numeric = self.__get_padding(self.var_rows[:mid])
+            self.var_row_sep = self.var_row_sep_last = self.__get_row_sep_str()
+            self.__reset_cell_cache()
+            for _ in self.__iter_body(mid, len(self.get_header()) + (6 if self.quote else 0)):
+                pass
+            if self.var_rows_shown == mid:
+                low = mid
+            else:
+                high = mid - 1
+        self.var_padding, self.var_profile, self.var_numeric = self.__get_padding(self.var_rows[:low])
+        self.var_row_sep = self.var_row_sep_last = self.__get_row_sep_str()
+        self.__reset_cell_cache()
+        return low
+
+    def __count_wrapped_lines(self, item):
+        """Upper bound of the lines a multiline row is split into. Every line holds at least one element,
+        i.e. a word of the cell or a part of a word split at an emoji, so there are no more lines than elements."""
+        lines = 0
+        for key in self.data[0].keys():
+            elements = 0
+            for line in item[key].split("\n"):
+                for token in line.split(self.multiline_delimiter):
+                    elements += 1
+                    if not self.var_profile[key]["ascii"]:
+                        elements += len(count_emojis(token))
+            lines = max(lines, elements)
+        return lines
+
+    def estimate_size(self):  # noqa: C901
+        """
+        Get the number of characters of `get_markdown()` without rendering the table, using the layout
+        computed by `set_params()`. `max_rows` is taken into account, while `max_output_chars` is not.
+
+        For padded tables without `multiline` the size is exact and computed in O(columns) time from the
+        column widths, the number of rows, `row_sep` and `quote`. Cells with emojis rendered with
+        `emoji_spacing="mono"` are only counted again if `max_rows` omits some of the scanned rows.
+        For `multiline` tables the size is an upper bound derived from the number of words in each cell
+        which has to be split. For the `gfm-compact` style the size is exact but every cell is measured.
+
+        Returns:
+            int: The (estimated) number of characters
+        """
+        self.__ensure_meta_params()
+        total = len(self.var_rows)
+        shown = total if self.max_rows is None else min(self.max_rows, total)
+        rows = self.var_rows[:shown]
+        quote = 6 if self.quote and self.style == "padded" else 0
+        end = len(self.__get_table_end(total - shown, shown > 0))
+        if self.style == "gfm-compact":
+            body = sum(len(self.__get_gfm_row(item, i)) for i, item in enumerate(rows))
+            return quote + len(self.__get_gfm_header()) + body + max(shown - 1, 0) * len(self.newline_char) + end
+
+        widths = dict(self.var_padding)
+        if self.multiline and not self.fit_width and self.layout is None:
+            # get_markdown() adds padding_width to the multiline widths once more
+            for key in widths:
+                widths[key] += self.padding_width[key]
+            if self.row_sep in ["topbottom", "always"] and (shown or self.row_sep == "topbottom"):
+                end += sum(widths.values()) - sum(self.var_padding.values())
+        width = sum(widths.values()) + len(widths) + 1
+        newline = len(self.newline_char)
+
+        def block(lines):
+            # characters of `lines` full-width lines joined by newlines
+            return lines * width + max(lines - 1, 0) * newline
+
+        def overflowing_line(item):
+            # unwrapped cells longer than the column width widen the line
+            return sum(max(widths[key], len(str(item[key]))) for key in widths) + len(widths) + 1
+
+        if not self.multiline:
+            header = block(1)
+            body = block(shown)
+            if self.emoji_spacing == "mono":
+                scanned = len(self.var_rows) if self.budget_widths == "all" else shown
+                for key, profile in self.var_profile.items():
+                    if shown == scanned:
+                        body -= profile["emojis"]
+                    elif profile["emojis"]:
+                        body -= sum(len(count_emojis(str(item[key]))) for item in rows)
+        else:
+            if self.multiline_strategy in ["header", "rows_and_header"]:
+                header = block(self.__count_wrapped_lines({key: key for key in widths}))
+            else:
+                header = overflowing_line({key: key for key in widths})
+            body = max(shown - 1, 0) * newline
+            for item in rows:
+                if self.multiline_strategy != "header" and self.__is_split_row(item):
+                    body += block(self.__count_wrapped_lines(item))
+                else:
+                    body += overflowing_line(item)
+
+        size = quote + header + newline
+        if self.row_sep in ["topbottom", "always"]:
+            size += width + 2 * newline
+        if self.row_sep in ["always", "markdown"]:
+            size += width + newline
+        if self.row_sep == "always":
+            size += max(shown - 1, 0) * (width + newline)
+        return size + body + end
+
+    def get_layout(self):
+        """
+        Get the layout of the table, i.e. the widths of its columns and the parameters they depend on.
+        The layout can be passed to `markdown_table` to render tables with the same columns without
+        computing their widths.
+
+        Returns:
+            Dict: The layout, which can be serialized as JSON
+        """
+        if self.style != "padded" or self.numeric_alignment:
+            raise ValueError("Layouts are only supported by padded tables without numeric_alignment.")
+        self.__ensure_meta_params()
+        return self.__get_layout(list(self.data[0].keys()))
+
+    def __get_layout(self, columns):
+        """Get the layout of the given columns with the widths rendered by get_markdown()"""
+        widths = {key: self.var_padding[key] for key in columns}
+        if self.var_multiline_pending:
+            widths = {key: widths[key] + self.padding_width[key] for key in columns}
+        layout = {"widths": widths}
+        for attr in _LAYOUT_PARAMS:
+            value = getattr(self, attr)
+            layout[attr] = {key: value[key] for key in columns} if isinstance(value, dict) else value
+        if self.multiline:
+            layout["multiline"] = {key: widths[key] - self.padding_width[key] for key in columns}
+        return layout
+
+    def save_layout(self, path):
+        """Save the layout returned by `get_layout()` as a JSON file"""
+        layout = self.get_layout()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(layout, file, ensure_ascii=False, indent=2)
+
+    def column_pages(self, max_width: int, repeat_columns: Optional[List[str]] = None):
+        """
+        Split the columns of the table into consecutive slices which are rendered as separate tables
+        no wider than `max_width` characters. The column widths are computed once for all slices and
+        each slice is only rendered when it is consumed. A column wider than `max_width` gets its own slice.
+        All slices show the same rows, i.e. the rows shown by `get_markdown()` within `max_rows` and `max_output_chars`.
+
+        Args:
+        `max_width` (int): Maximum width of each slice in characters. \n
+        `repeat_columns` (List[str], optional): Columns repeated at the beginning of every slice, e.g. to identify the rows.
+            Default is `None`. \n
+
+        Returns:
+            Iterator[str]: The output of `get_markdown()` for each slice of columns
+        """
+        if self.style != "padded":
+            raise ValueError(f"column_pages is not supported by the '{self.style}' style.")
+        if not isinstance(max_width, int) or max_width < 1:
+            raise ValueError(f"max_width value of '{max_width}' is not valid. Please use a positive integer.")
+        repeat_columns = list(repeat_columns or [])
+        unknown = [key for key in repeat_columns if key not in self.data[0]]
+        if unknown:
+            raise ValueError(f"repeat_columns values {unknown} are not valid. Possible values are {list(self.data[0].keys())}.")
+        return self.__iter_column_pages(max_width, repeat_columns)
+
+    def __iter_column_pages(self, max_width, repeat_columns):
+        self.__update_meta_params()
+        self.var_multiline_pending = False
+        shown = self.__get_budget_limit()
+        if self.max_output_chars is not None:
+            # every slice shows the rows which fit into the output budget of the complete table
+            for _ in self.__iter_body(shown, len(self.get_header()) + (6 if self.quote else 0)):
+                pass
+            shown = self.var_rows_shown
+        # every column takes up its width and a separator, plus the closing separator of the row
+        repeated_width = sum(self.var_padding[key] + 1 for key in repeat_columns) + 1
+        pages, page, width = [], [], repeated_width
+        for key in self.data[0].keys():
+            if key in repeat_columns:
+                continue
+            if page and width + self.var_padding[key] + 1 > max_width:
+                pages.append(page)
+                page, width = [], repeated_width
+            page.append(key)
+            width += self.var_padding[key] + 1
+        if page or not pages:
+            pages.append(page)
+        for page in pages:
+            yield self.__get_column_page(repeat_columns + page, shown)
+
+    def __get_column_page(self, columns, shown):
+        """Render the given columns as a separate table using the widths of the complete table"""
+        rows = []
+        # omitted rows are only counted in the footer, the first one is kept for the columns of a table without rows
+        for i, item in enumerate(self.var_rows[:max(shown, 1)]):
+            row = {}
+            for key in columns:
+                # numeric columns are already formatted and padded
+                numeric = self.var_numeric.get(key)
+                row[key] = numeric[i] if numeric is not None and i < len(numeric) else item[key]
+            rows.append(row)
+        page = markdown_table(rows, skip_data_validation=True, layout=self.__get_layout(columns))
+        page.max_rows = shown
+        page.omitted_rows = len(self.var_rows) - len(rows)
+        return page.get_markdown()
+
+    def __widen_layout(self):
+        """Widen the columns of the layout which the data does not fit into"""
+        columns = [key for key in self.data[0].keys() if key in self.var_overflow]
+        if self.strict_layout:
+            raise ValueError(
+                f"The data does not fit into the layout widths of the columns {columns}. "
+                f"Please use a wider layout or set strict_layout to False."
+            )
+        if not self.multiline:
+            padding = self.__get_padding(self.var_rows)[0]
+            for key in columns:
+                self.layout[key] = max(self.layout[key], padding[key])
+            return
+        # multiline columns only need to fit their longest element
+        for key in columns:
+            texts = [key] if self.multiline_strategy in ["header", "rows_and_header"] else []
+            if self.multiline_strategy in ["rows", "rows_and_header"]:
+                texts += [str(item[key]) for item in self.var_rows]
+            width = max(
+                len(token) + (0 if token.isascii() else len(count_emojis(token)))
+                for text in texts for line in text.split("\n") for token in line.split(self.multiline_delimiter)
+            )
+            self.layout[key] = max(self.layout[key], width + self.padding_width[key])
+
+    def stream_markdown(self):
+        """Yield the complete markdown table in chunks, rendering each row only once it is consumed.
+        Tables rendered with a layout are yielded once all of their rows are known to fit into it."""
+        self.__update_meta_params()
+        self.var_multiline_pending = False
+        if self.layout is None:
+            yield from self.__iter_markdown()
+            return
+        chunks = list(self.__iter_markdown())
+        if self.var_overflow:
+            self.__widen_layout()
+            self.__update_meta_params()
+            chunks = list(self.__iter_markdown())
+        yield from chunks
+
+    def __iter_markdown(self):
+        limit = self.__get_budget_limit()
+        header = self.get_header()
+        # a fenced pipe table would be rendered as a code block
+        quote = self.quote and self.style == "padded"
+        if quote:
+            yield "```"
+        yield header
+        # quotes count towards the output budget
+        yield from self.__iter_body(limit, len(header) + (6 if quote else 0))
+        if quote:
+            yield "```"
 
     def get_markdown(self):
         """Get the complete markdown table"""
-        self.__update_meta_params()
-        data = self.get_header() + self.get_body()
-        if self.quote:
-            return "```" + data + "```"
-        return data
\ No newline at end of file
+        return "".join(self.stream_markdown())
+
+def _get_template_params(data, params):
+    """Validate `params` with set_params() on the first row of `data`. The returned parameters can be used by
+    markdown_table._render() and markdown_table._get_layout() for any table with the same columns."""
+    if not isinstance(data, list) or len(data) == 0 or not isinstance(data[0], dict):
+        # let the constructor raise the appropriate error
+        markdown_table(data)
+    template_params = dict(params)
+    if isinstance(params.get("multiline"), dict):
+        # set_params() offsets the multiline widths in place
+        template_params["multiline"] = dict(params["multiline"])
+    template = markdown_table(data[:1], skip_data_validation=True).set_params(**template_params)
+    validated = {
+        key: value for key, value in vars(template).items()
+        if not key.startswith("var_") and key not in ["data", "skip_data_validation"]
+    }
+    validated["multiline"] = params.get("multiline")
+    return validated
+
+
+def _render_chunk(chunk, skip_data_validation):
+    """Render a chunk of `(data, params)` pairs. Module-level so that it can be pickled by process pools."""
+    return [markdown_table._render(data, params, skip_data_validation) for data, params in chunk]
+
+
+def render_many(
+    datasets: Iterable[List[Dict]],
+    executor: Optional[Executor] = None,
+    chunksize: int = 64,
+    skip_data_validation: bool = False,
+    **params,
+) -> List[str]:
+    """
+    Render many independent tables sharing the same rendering parameters.
+
+    Args:
+    `datasets` (Iterable[List[Dict]]): The data of each table, see `markdown_table`. \n
+    `executor` (Executor, optional): A `concurrent.futures` thread or process pool used to render the tables.
+        Default is `None`, which renders the tables serially. \n
+    `chunksize` (int, optional): Number of tables submitted to the executor at once, amortizing the IPC overhead of process pools.
+        Default is `64`. \n
+    `skip_data_validation` (bool, optional): See `markdown_table`.
+        Default is `False`. \n
+    `**params`: Rendering parameters, see `markdown_table.set_params()`. They are validated once for every distinct set of columns.
+
+    Returns:
+        List[str]: The output of `get_markdown()` for each dataset, in input order.
+    """
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f"chunksize value of '{chunksize}' is not valid. Please use a positive integer.")
+
+    # validated parameters per set of columns, as per-column parameters are expanded from the keys
+    validated = {}
+    pairs = []
+    for data in datasets:
+        if not isinstance(data, list) or len(data) == 0 or not isinstance(data[0], dict):
+            # let the constructor raise the appropriate error
+            markdown_table(data, skip_data_validation)
+        columns = tuple(data[0].keys())
+        if columns not in validated:
+            validated[columns] = _get_template_params(data, params)
+        pairs.append((data, validated[columns]))
+
+    chunks = [pairs[i:i + chunksize] for i in range(0, len(pairs), chunksize)]
+    if executor is None:
+        results = map(_render_chunk, chunks, repeat(skip_data_validation))
+    else:
+        results = executor.map(_render_chunk, chunks, repeat(skip_data_validation))
+    return [markdown for chunk in results for markdown in chunk]
+
+
+def shared_layout(
+    datasets: Iterable[List[Dict]],
+    skip_data_validation: bool = False,
+    **params,
+) -> Dict:
+    """
+    Compute a single layout for many tables with the same columns, so that they line up when rendered one after another.
+    Each dataset is scanned once and its column widths are merged into the widest width of each column.
+
+    Args:
+    `datasets` (Iterable[List[Dict]]): The data of each table, see `markdown_table`. \n
+    `skip_data_validation` (bool, optional): See `markdown_table`.
+        Default is `False`. \n
+    `**params`: Rendering parameters stored in the layout, see `markdown_table.set_params()`. Parameters which are not part
+        of a layout, such as `fit_width`, `sort_by`, `limit` or `max_rows`, are not supported as the tables would not line up.
+
+    Returns:
+        Dict: The shared layout, which renders each dataset with `markdown_table(data, layout=layout)` without scanning it again.
+    """
+    unsupported = [key for key in params if key not in _LAYOUT_PARAMS]
+    if unsupported:
+        raise ValueError(f"{unsupported} are not supported by shared layouts. Possible parameters are {_LAYOUT_PARAMS}.")
+
+    layout = None
+    validated = None
+    for data in datasets:
+        if validated is None:
+            validated = _get_template_params(data, params)
+        table_layout = markdown_table._get_layout(data, validated, skip_data_validation)
+        if layout is None:
+            layout = table_layout
+            continue
+        for key, width in table_layout["widths"].items():
+            layout["widths"][key] = max(layout["widths"][key], width)
+
+    if layout is None:
+        raise ValueError("datasets contains no elements.")
+    if layout["multiline"]:
+        layout["multiline"] = {key: width - layout["padding_width"][key] for key, width in layout["widths"].items()}
+    return layout
@@ -0,0 +1,193 @@
+"""Differential tests: every rendering path has to match the frozen reference algorithm byte for byte."""
+import copy
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from py_markdown_table.markdown_table import markdown_table, render_many
+from reference_markdown_table import reference_markdown_table
+
+TABLES_PER_CASE = 60
+
+# low-cardinality vocabulary so that cached cells are reused, mixed with unique values below
+WORDS = ["a", "bb", "ccc", "dddd", "Vrij", "Zwemmen", "21:30-23:00", "24/24", "😊", "🌍🎉", "x😊y", "ok"]
+HEADERS = ["title", "time", "a b c", "😊 emoji", "seats", "x"]
+
+
+def generate_cell(rng, multiline, delimiter):
+    if not multiline:
+        kind = rng.random()
+        if kind < 0.15:
+            return rng.uniform(-1000, 1000)
+        if kind < 0.2:
+            return rng.randint(-50, 5000)
+        if kind < 0.3:
+            return f"unique{rng.random()}"
+    separators = [" ", delimiter, "\n"] if multiline else [" "]
+    cell = rng.choice(WORDS)
+    for _ in range(rng.randint(0, 5)):
+        cell += rng.choice(separators) + rng.choice(WORDS)
+    return cell
+
+
+def token_width(text, delimiter):
+    # upper bound for the widest element the multiline renderer can produce from `text`,
+    # emojis take up an extra character
+    tokens = text.split(delimiter)
+    return max(len(token) + sum(ord(char) > 0xFFFF for char in token) for token in tokens)
+
+
+def generate_table(rng, row_sep, padding_weight):
+    keys = rng.sample(HEADERS, rng.randint(1, 4))
+    multiline = rng.random() < 0.35
+    delimiter = rng.choice([" ", "-"]) if multiline else " "
+    data = [{key: generate_cell(rng, multiline, delimiter) for key in keys} for _ in range(rng.randint(1, 8))]
+    params = {
+        "row_sep": row_sep,
+        "padding_weight": padding_weight if rng.random() < 0.7 else {key: rng.choice(["left", "right", "centerleft", "centerright"]) for key in keys},
+        "padding_width": rng.choice([0, 1, 3, {key: rng.randint(0, 3) for key in keys}]),
+        "padding_char": rng.choice([" ", " ", ".", "*"]),
+        "newline_char": rng.choice(["\n", "\n", "\r\n"]),
+        "quote": rng.random() < 0.5,
+    }
+    if any(isinstance(value, float) for row in data for value in row.values()):
+        params["float_rounding"] = rng.choice([None, 1, 2, 4])
+    if all(isinstance(value, str) for row in data for value in row.values()) and rng.random() < 0.5:
+        params["emoji_spacing"] = "mono"
+    if multiline:
+        params["multiline_delimiter"] = delimiter
+        params["multiline_strategy"] = rng.choice(["rows", "header", "rows_and_header"])
+        params["multiline"] = {
+            key: max([token_width(row[key], delimiter) for row in data] + [token_width(key, delimiter)]) + rng.randint(0, 8)
+            for key in keys
+        }
+    return data, params
+
+
+def render_get_markdown(data, params, table_class=markdown_table):
+    return table_class(copy.deepcopy(data)).set_params(**copy.deepcopy(params)).get_markdown()
+
+
+def render_stream_markdown(data, params):
+    return "".join(markdown_table(copy.deepcopy(data)).set_params(**copy.deepcopy(params)).stream_markdown())
+
+
+def render_header_body(data, params, table_class=markdown_table):
+    # without get_markdown() multiline widths are padded once only, which differs from get_markdown() in both versions
+    mt = table_class(copy.deepcopy(data)).set_params(**copy.deepcopy(params))
+    table = mt.get_header() + mt.get_body()
+    return "```" + table + "```" if mt.quote else table
+
+
+def render_render_many(data, params):
+    return render_many([copy.deepcopy(data)], **copy.deepcopy(params))[0]
+
+
+def render_layout(data, params):
+    mt = markdown_table(copy.deepcopy(data)).set_params(**copy.deepcopy(params))
+    # the layout of the same data fits, so it is rendered in a single pass
+    layout = json.loads(json.dumps(mt.get_layout()))
+    return markdown_table(copy.deepcopy(data), layout=layout, strict_layout=True).get_markdown()
+
+
+def render_reference(data, params):
+    return render_get_markdown(data, params, reference_markdown_table)
+
+
+def render_reference_header_body(data, params):
+    return render_header_body(data, params, reference_markdown_table)
+
+
+# path name: (optimized renderer, reference renderer)
+PATHS = {
+    "get_markdown": (render_get_markdown, render_reference),
+    "stream_markdown": (render_stream_markdown, render_reference),
+    "header_body": (render_header_body, render_reference_header_body),
+    "render_many": (render_render_many, render_reference),
+    "layout": (render_layout, render_reference),
+}
+
+
+@pytest.mark.parametrize("padding_weight", ["left", "right", "centerleft", "centerright"])
+@pytest.mark.parametrize("row_sep", ["always", "topbottom", "markdown", None])
+def test_paths_match_reference(row_sep, padding_weight, record_property):
+    rng = random.Random(f"{row_sep}-{padding_weight}")
+    tables = [generate_table(rng, row_sep, padding_weight) for _ in range(TABLES_PER_CASE)]
+
+    for path, (render, reference) in PATHS.items():
+        start = time.perf_counter()
+        expected = [reference(data, params) for data, params in tables]
+        record_property(f"seconds_reference_{path}", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for index, (data, params) in enumerate(tables):
+            assert render(data, params) == expected[index], f"{path} differs for {params} and {data}"
+        record_property(f"seconds_{path}", time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("row_sep", ["always", "topbottom", "markdown", None])
+def test_parallel_render_many_matches_reference(row_sep, record_property):
+    rng = random.Random(f"parallel-{row_sep}")
+    params = {"row_sep": row_sep, "padding_width": rng.randint(0, 3), "padding_weight": rng.choice(["left", "centerright"])}
+    datasets = []
+    for _ in range(TABLES_PER_CASE):
+        # render_many shares its parameters across tables, so only the data is random
+        data, _ = generate_table(rng, row_sep, "left")
+        datasets.append([{key: str(value) for key, value in row.items()} for row in data])
+    expected = [render_reference(data, params) for data in datasets]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert render_many(copy.deepcopy(datasets), executor=executor, chunksize=7, **params) == expected
+    record_property("seconds_render_many_threads", time.perf_counter() - start)
+
+
+def best_times(reference, render, repeat=5):
+    # the runs alternate so that noise from other processes affects both, and the fastest run is the least affected
+    reference_timings, timings = [], []
+    for _ in range(repeat):
+        for run, run_timings in [(reference, reference_timings), (render, timings)]:
+            start = time.perf_counter()
+            run()
+            run_timings.append(time.perf_counter() - start)
+    return min(reference_timings), min(timings)
+
+
+def generate_small_tables(seed):
+    rng = random.Random(seed)
+    return [
+        [{"name": f"item{rng.random()}", "value": rng.uniform(0, 100), "count": rng.randint(0, 9), "text": rng.choice(WORDS)} for _ in range(5)]
+        for _ in range(2000)
+    ]
+
+
+def test_small_tables_not_slower_than_reference(record_property):
+    # the per-table overhead of profiling the columns dominates for many small tables
+    tables = generate_small_tables("small")
+    assert [markdown_table(data).get_markdown() for data in tables] == [reference_markdown_table(data).get_markdown() for data in tables]
+
+    reference_seconds, seconds = best_times(
+        lambda: [reference_markdown_table(data).get_markdown() for data in tables],
+        lambda: [markdown_table(data).get_markdown() for data in tables],
+    )
+    record_property("seconds_reference_small_tables", reference_seconds)
+    record_property("seconds_small_tables", seconds)
+    # generous margin for timing noise, a per-table regression like an extra pass over every column exceeds it
+    assert seconds < 1.25 * reference_seconds
+
+
+def test_render_many_faster_than_serial_loop(record_property):
+    tables = generate_small_tables("render_many")
+    params = {"row_sep": "markdown", "padding_width": 1, "padding_weight": "left"}
+    expected = [reference_markdown_table(data).set_params(**params).get_markdown() for data in tables]
+    assert render_many(tables, **params) == expected
+
+    reference_seconds, seconds = best_times(
+        lambda: [reference_markdown_table(data).set_params(**params).get_markdown() for data in tables],
+        lambda: render_many(tables, **params),
+    )
+    record_property("seconds_reference_serial_loop", reference_seconds)
+    record_property("seconds_render_many_serial", seconds)
+    # the parameters are validated once and each table is scanned once instead of once per call
+    assert seconds < 0.8 * reference_seconds
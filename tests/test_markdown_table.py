@@ -1,5 +1,11 @@
+import copy
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import pytest
-from py_markdown_table.markdown_table import markdown_table
+from py_markdown_table.markdown_table import markdown_table, render_many, shared_layout
+from py_markdown_table.utils import count_emojis
 
 bad_data_0 = []
 
@@ -45,6 +51,13 @@ multirow_header_data = [
     {"those are multi rows": "no they are not"},
 ]
 
+latency_data = [
+    {"service": "api", "latency": 12},
+    {"service": "db", "latency": 250},
+    {"service": "cache", "latency": 3},
+    {"service": "auth", "latency": 40},
+]
+
 emoji_data = [
     {"title": "Vrij Zwemmen", "time": "21:30-23:00", "date": "😊", "seats": "24/24"},
     {
@@ -162,3 +175,467 @@ def test_emoji_multiline_data(params, expected_output):
     mt = markdown_table(emoji_multiline_data).set_params(**params).get_markdown()
     assert mt == expected_output
 
+
+
+@pytest.mark.parametrize("params, expected_output", [
+    ({"row_sep": "always", "max_rows": 2}, "```\n+------------+-----------+---------+-----+\n|    title   |    time   |   date  |seats|\n+------------+-----------+---------+-----+\n|Vrij Zwemmen|21:30-23:00|Wed 09.12|24/24|\n+------------+-----------+---------+-----+\n|Vrij Zwemmen|12:00-13:00|Thu 10.12|18/18|\n+------------+-----------+---------+-----+\n2 more rows omitted```"),
+    ({"row_sep": "markdown", "max_rows": 0}, "```|    title   |    time   |   date  |seats|\n|------------|-----------|---------|-----|\n4 more rows omitted```"),
+    ({"row_sep": "topbottom", "max_output_chars": 200}, "```\n+------------+-----------+---------+-----+\n|    title   |    time   |   date  |seats|\n|Vrij Zwemmen|21:30-23:00|Wed 09.12|24/24|\n+------------+-----------+---------+-----+\n3 more rows omitted```"),
+    ({"row_sep": "topbottom", "max_output_chars": 1000}, "```\n+------------+-----------+---------+-----+\n|    title   |    time   |   date  |seats|\n|Vrij Zwemmen|21:30-23:00|Wed 09.12|24/24|\n|Vrij Zwemmen|12:00-13:00|Thu 10.12|18/18|\n|Vrij Zwemmen| 7:30-8:30 |Fri 11.12|18/18|\n|Vrij Zwemmen|13:15-14:15|Sat 12.12|18/18|\n+------------+-----------+---------+-----+```"),
+])
+def test_output_budget(params, expected_output):
+    mt = markdown_table(formatting_data).set_params(**params).get_markdown()
+    assert mt == expected_output
+    if params.get("max_output_chars"):
+        assert len(mt) <= params["max_output_chars"]
+
+
+def test_output_budget_shown_widths():
+    data = [{"A": "x" * i} for i in range(1, 6)]
+    mt = markdown_table(data).set_params(row_sep="markdown", max_rows=2, budget_widths="shown").get_markdown()
+    assert mt == "```| A|\n|--|\n| x|\n|xx|\n3 more rows omitted```"
+    mt = markdown_table(data).set_params(row_sep="markdown", max_output_chars=40, budget_widths="shown").get_markdown()
+    assert mt == "```|A|\n|-|\n|x|\n4 more rows omitted```"
+
+
+@pytest.mark.parametrize("params, expected_output", [
+    ({"row_sep": "markdown", "sort_by": "latency", "limit": 2}, "```|service|latency|\n|-------|-------|\n|   db  |  250  |\n|  auth |   40  |```"),
+    ({"row_sep": "markdown", "sort_by": "latency", "sort_order": "ascending"}, "```|service|latency|\n|-------|-------|\n| cache |   3   |\n|  api  |   12  |\n|  auth |   40  |\n|   db  |  250  |```"),
+    ({"row_sep": "markdown", "limit": 1}, "```|service|latency|\n|-------|-------|\n|  api  |   12  |```"),
+])
+def test_row_selection(params, expected_output):
+    mt = markdown_table(latency_data).set_params(**params).get_markdown()
+    assert mt == expected_output
+    assert [row["service"] for row in latency_data] == ["api", "db", "cache", "auth"]
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"sort_by": "a"}, [3, 1, None, None]),
+    ({"sort_by": "a", "limit": 2}, [3, 1]),
+    ({"sort_by": "a", "sort_order": "ascending"}, [1, 3, None, None]),
+    ({"sort_by": "a", "sort_order": "ascending", "limit": 3}, [1, 3, None]),
+])
+def test_row_selection_none_last(params, expected):
+    data = [{"a": 1}, {"a": None}, {"a": 3}, {"a": None}]
+    markdown = markdown_table(data).set_params(row_sep="markdown", quote=False, **params).get_markdown()
+    assert [line.strip("| ") for line in markdown.split("\n")[2:]] == [str(value) for value in expected]
+
+
+def test_row_selection_incomparable():
+    with pytest.raises(ValueError):
+        markdown_table([{"a": 1}, {"a": "b"}]).set_params(sort_by="a")
+    with pytest.raises(ValueError):
+        markdown_table([{"a": 1}, {"a": "b"}, {"a": 2}]).set_params(sort_by="a", limit=1)
+
+
+class Counted:
+    """Cell value counting how often it is converted to a string"""
+    conversions = 0
+
+    def __str__(self):
+        Counted.conversions += 1
+        return "counted"
+
+
+def test_row_selection_widths_of_selected_rows():
+    data = [{"latency": i, "note": Counted()} for i in range(100)]
+    Counted.conversions = 0
+    mt = markdown_table(data).set_params(sort_by="latency", limit=2)
+    # only the two selected rows are scanned for their widths
+    assert Counted.conversions == 2
+    assert mt.get_header() == "\n+-------+-------+\n|latency|  note |\n+-------+-------+\n"
+
+
+@pytest.mark.parametrize("params", [{"sort_by": "missing"}, {"sort_order": "up"}, {"limit": 0}])
+def test_row_selection_bad_params(params):
+    with pytest.raises(ValueError):
+        markdown_table(latency_data).set_params(**params)
+
+
+@pytest.mark.parametrize("params", [
+    {"row_sep": "topbottom", "padding_width": 2},
+    {"row_sep": "markdown", "multiline": {"A": 12, "B": 12, "C": 9}, "padding_width": 1},
+])
+def test_render_many(params):
+    datasets = [formatting_data, multiline_data, latency_data] if "multiline" not in params else [multiline_data] * 3
+    expected = [markdown_table(copy.deepcopy(data)).set_params(**copy.deepcopy(params)).get_markdown() for data in datasets]
+    assert render_many(datasets, **params) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert render_many(datasets, executor=executor, chunksize=2, **params) == expected
+
+
+@pytest.mark.parametrize("datasets, params", [
+    ([formatting_data, []], {}),
+    ([formatting_data], {"row_sep": "invalid"}),
+    ([formatting_data], {"chunksize": 0}),
+])
+def test_render_many_bad_input(datasets, params):
+    with pytest.raises(ValueError):
+        render_many(datasets, **params)
+
+
+def test_emoji_data_with_numeric_column():
+    data = [{"service": "api 😊", "latency": 12.5}, {"service": "db", "latency": 250}]
+    mt = markdown_table(data).set_params(row_sep="markdown", emoji_spacing="mono").get_markdown()
+    assert mt == "```|service|latency|\n|-------|-------|\n| api 😊|  12.5 |\n|   db  |  250  |```"
+
+
+@pytest.mark.parametrize("params, expected_output", [
+    ({"style": "gfm-compact", "quote": False, "float_rounding": 2, "padding_weight": {"name": "right", "note": "centerleft", "v": "left"}}, "|name|note|v|\n|:---|:---:|---:|\n|a\\|b|x<br>y|1.23|\n|c||2|"),
+    ({"style": "gfm-compact", "row_sep": "always", "max_rows": 1}, "|name|note|v|\n|:---:|:---:|:---:|\n|a\\|b|x<br>y|1.23456|\n\n1 more row omitted"),
+    ({"style": "gfm-compact", "max_rows": 0}, "|name|note|v|\n|:---:|:---:|:---:|\n\n2 more rows omitted"),
+])
+def test_gfm_compact(params, expected_output):
+    data = [{"name": "a|b", "note": "x\ny", "v": 1.23456}, {"name": "c", "note": "", "v": 2}]
+    mt = markdown_table(data).set_params(**params)
+    assert mt.get_markdown() == expected_output
+    assert "".join(mt.stream_markdown()) == expected_output
+    assert mt.estimate_size() == len(expected_output)
+
+
+def test_gfm_compact_backslash():
+    mt = markdown_table([{"path": "C:\\", "size": "a\\|b"}]).set_params(style="gfm-compact")
+    assert mt.get_markdown() == "|path|size|\n|:---:|:---:|\n|C:\\\\|a\\\\\\|b|"
+
+
+def test_gfm_compact_skips_width_scan():
+    data = [{"latency": i, "note": Counted()} for i in range(100)]
+    Counted.conversions = 0
+    markdown = markdown_table(data).set_params(style="gfm-compact").get_markdown()
+    # every cell is converted once while rendering, but never to compute widths
+    assert Counted.conversions == 100
+    assert markdown.endswith("|99|counted|")
+
+
+def test_gfm_compact_multiline():
+    with pytest.raises(ValueError):
+        markdown_table(multiline_data).set_params(style="gfm-compact", multiline={"A": 30, "B": 30, "C": 10})
+
+
+@pytest.mark.parametrize("params", [{}, {"row_sep": "topbottom", "max_rows": 2}, {"row_sep": "markdown", "quote": False}])
+def test_stream_markdown(params):
+    mt = markdown_table(formatting_data).set_params(**params)
+    chunks = list(mt.stream_markdown())
+    assert len(chunks) > len(formatting_data)
+    assert "".join(chunks) == mt.get_markdown()
+
+
+@pytest.mark.parametrize("params, expected_output", [
+    ({"numeric_alignment": "right"}, "|host|  p50  |  p99 |\n|----|-------|------|\n|  a |    1.5|   120|\n| bb |  12.25|     7|\n|  c |  0.125|  1000|"),
+    ({"numeric_alignment": "right", "float_rounding": 2}, "|host|  p50  |  p99 |\n|----|-------|------|\n|  a |   1.50|   120|\n| bb |  12.25|     7|\n|  c |   0.12|  1000|"),
+    ({"numeric_alignment": "decimal"}, "|host|   p50  |  p99 |\n|----|--------|------|\n|  a |   1.5  |   120|\n| bb |  12.25 |     7|\n|  c |   0.125|  1000|"),
+])
+def test_numeric_alignment(params, expected_output):
+    data = [{"host": "a", "p50": 1.5, "p99": 120}, {"host": "bb", "p50": 12.25, "p99": 7}, {"host": "c", "p50": 0.125, "p99": 1000}]
+    mt = markdown_table(data).set_params(row_sep="markdown", quote=False, padding_width=2, **params).get_markdown()
+    assert mt == expected_output
+
+
+@pytest.mark.parametrize("params", [
+    {"numeric_alignment": "left"},
+    {"numeric_alignment": "right", "style": "gfm-compact"},
+    {"numeric_alignment": "right", "multiline": {"A": 30, "B": 30, "C": 10}},
+])
+def test_numeric_alignment_bad_params(params):
+    with pytest.raises(ValueError):
+        markdown_table(multiline_data).set_params(**params)
+
+
+@pytest.mark.parametrize("params, expected_output", [
+    ({"fit_width": 40, "row_sep": "topbottom"}, "```\n+---------------+---------------+------+\n|       A       |       B       |   C  |\n|   row1_A and  |     row1_B    |row1_C|\n|   additional  |               |      |\n|     stuff     |               |      |\n|     row2_A    |   row2_B and  |row2_C|\n|               |   additional  |      |\n|               |     stuff     |      |\n|     row3_A    |     row3_B    |row3_C|\n+---------------+---------------+------+```"),
+])
+def test_fit_width(params, expected_output):
+    mt = markdown_table(multiline_data).set_params(**params).get_markdown()
+    assert mt == expected_output
+    assert max(len(line) for line in mt.strip("`").split("\n")) <= params["fit_width"]
+
+
+@pytest.mark.parametrize("params", [
+    {"fit_width": 20},
+    {"fit_width": 0},
+    {"fit_width": 80, "multiline": {"A": 30, "B": 30, "C": 10}},
+    {"fit_width": 80, "style": "gfm-compact"},
+])
+def test_fit_width_bad_params(params):
+    with pytest.raises(ValueError):
+        markdown_table(multiline_data).set_params(**params)
+
+
+def test_fit_width_unwrapped_rows():
+    data = [{"A": "one two three four five six seven eight", "B": "x"}]
+    with pytest.raises(ValueError):
+        markdown_table(data).set_params(fit_width=20, multiline_strategy="header")
+    mt = markdown_table(data).set_params(fit_width=50, multiline_strategy="header", quote=False).get_markdown()
+    assert len({len(line) for line in mt.split("\n") if line}) == 1
+
+
+@pytest.mark.parametrize("strategy", ["rows", "rows_and_header"])
+def test_fit_width_emoji(strategy):
+    data = [{"A": "bb Vrij 🌍🎉 🌍🎉", "B": "🌍🎉 😊"}, {"A": "bb 😊 🌍🎉 😊 dddd", "B": "dddd"}]
+    params = {"fit_width": 27, "multiline_strategy": strategy, "emoji_spacing": "mono", "quote": False}
+    mt = markdown_table(data).set_params(**params).get_markdown()
+    # emojis are displayed two characters wide
+    widths = {len(line) + len(count_emojis(line)) for line in mt.split("\n") if line}
+    assert len(widths) == 1 and widths.pop() <= 27
+
+
+def test_multiline_emoji_rows_split_by_length():
+    # only fit_width tables count the extra characters of emojis when deciding whether to split a row
+    data = [{"A": "ab 😊😊", "B": "c"}]
+    params = {"multiline": {"A": 5, "B": 1}, "emoji_spacing": "mono", "row_sep": None, "quote": False}
+    assert markdown_table(data).set_params(**params).get_markdown() == "|  A  |B|\n|ab 😊😊|c|"
+    params = {"fit_width": 10, "emoji_spacing": "mono", "row_sep": None, "quote": False}
+    assert markdown_table(data).set_params(**params).get_markdown() == "|   A  |B|\n|ab  😊|c|\n|  😊  | |"
+
+
+def test_cell_cache():
+    data = [{"status": ["ok", "warning", "error"][i % 3], "id": str(i)} for i in range(3000)]
+    mt = markdown_table(data).set_params(row_sep="markdown", padding_weight="right")
+    rows = mt.get_markdown().split("\n")
+    assert rows[2] == "|ok     |0   |"
+    assert rows[-1] == "|error  |2999|```"
+    assert len(mt.var_cell_cache["status"]) == 3
+    # the cache switches itself off for high-cardinality columns
+    assert mt.var_cell_cache["id"] is None
+
+
+@pytest.mark.parametrize("params", [
+    {"row_sep": "always"},
+    {"row_sep": "topbottom", "padding_width": 3, "quote": False},
+    {"row_sep": "markdown", "max_rows": 2},
+    {"row_sep": None, "newline_char": "\r\n"},
+    {"style": "gfm-compact", "max_rows": 3},
+])
+def test_estimate_size(params):
+    mt = markdown_table(formatting_data).set_params(**params)
+    assert mt.estimate_size() == len(mt.get_markdown())
+
+
+def test_estimate_size_emoji():
+    mt = markdown_table(emoji_data).set_params(row_sep="topbottom", emoji_spacing="mono")
+    assert mt.estimate_size() == len(mt.get_markdown())
+
+
+@pytest.mark.parametrize("params", [
+    {"multiline": {"A": 12, "B": 12, "C": 9}, "padding_width": 1},
+    {"multiline": {"A": 12, "B": 12, "C": 9}, "multiline_strategy": "header"},
+    {"fit_width": 40, "multiline_strategy": "rows_and_header"},
+])
+def test_estimate_size_multiline(params):
+    mt = markdown_table(multiline_data).set_params(**params)
+    assert mt.estimate_size() >= len(mt.get_markdown())
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 1000])
+def test_from_cursor(batch_size):
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE latency (service TEXT, latency INTEGER)")
+    connection.executemany("INSERT INTO latency VALUES (:service, :latency)", latency_data)
+    cursor = connection.execute("SELECT service, latency FROM latency")
+    mt = markdown_table.from_cursor(cursor, batch_size=batch_size).set_params(row_sep="markdown")
+    assert mt.get_markdown() == markdown_table(latency_data).set_params(row_sep="markdown").get_markdown()
+    connection.close()
+
+
+def test_from_cursor_bad_input():
+    connection = sqlite3.connect(":memory:")
+    with pytest.raises(ValueError):
+        markdown_table.from_cursor(connection.execute("SELECT 1"), batch_size=0)
+    with pytest.raises(ValueError):
+        markdown_table.from_cursor(connection.execute("CREATE TABLE empty (a TEXT)"))
+    connection.close()
+
+
+def test_from_cursor_duplicate_columns():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE service (id INTEGER, name TEXT)")
+    connection.execute("CREATE TABLE latency (id INTEGER, service_id INTEGER, latency INTEGER)")
+    connection.execute("INSERT INTO service VALUES (1, 'auth')")
+    connection.execute("INSERT INTO latency VALUES (7, 1, 12)")
+    query = "SELECT {} FROM service JOIN latency ON service.id = latency.service_id"
+    with pytest.raises(ValueError, match=r"\['id'\]"):
+        markdown_table.from_cursor(connection.execute(query.format("*")))
+    mt = markdown_table.from_cursor(connection.execute(query.format("service.id AS service, latency.id, latency")))
+    assert mt.data == [{"service": 1, "id": 7, "latency": 12}]
+    connection.close()
+
+
+@dataclass
+class Latency:
+    service: str
+    latency: int
+
+
+LatencyTuple = namedtuple("LatencyTuple", ["service", "latency"])
+
+
+@pytest.mark.parametrize("objs", [
+    [Latency(**row) for row in latency_data],
+    [LatencyTuple(**row) for row in latency_data],
+])
+def test_from_objects(objs):
+    mt = markdown_table.from_objects(objs, ["service", "latency"]).set_params(row_sep="markdown")
+    assert mt.get_markdown() == markdown_table(latency_data).set_params(row_sep="markdown").get_markdown()
+    mt = markdown_table.from_objects(objs, ["latency"]).set_params(row_sep="markdown", quote=False)
+    assert mt.get_markdown() == "|latency|\n|-------|\n|   12  |\n|  250  |\n|   3   |\n|   40  |"
+
+
+def test_from_objects_duplicate_fields():
+    with pytest.raises(ValueError, match=r"\['latency'\]"):
+        markdown_table.from_objects([Latency(**row) for row in latency_data], ["latency", "service", "latency"])
+
+
+def test_layout_roundtrip(tmp_path):
+    mt = markdown_table(latency_data).set_params(row_sep="topbottom", padding_width=2, padding_weight="left")
+    expected = mt.get_markdown()
+    path = tmp_path / "layout.json"
+    mt.save_layout(path)
+    assert markdown_table(latency_data, layout=str(path)).get_markdown() == expected
+    assert markdown_table(latency_data, layout=mt.get_layout(), strict_layout=True).get_markdown() == expected
+
+
+@pytest.mark.parametrize("strategy", ["rows", "header", "rows_and_header"])
+def test_layout_multiline_roundtrip(strategy):
+    params = {"multiline": {"A": 12, "B": 12, "C": 9}, "multiline_strategy": strategy, "padding_width": 2}
+    mt = markdown_table(multiline_data).set_params(**copy.deepcopy(params))
+    # the layout holds the widths rendered by get_markdown(), whether it is taken before or after rendering
+    layout = mt.get_layout()
+    expected = mt.get_markdown()
+    assert mt.get_layout() == layout
+    assert markdown_table(multiline_data, layout=layout, strict_layout=True).get_markdown() == expected
+    assert shared_layout([multiline_data], **params) == layout
+
+
+def test_layout_widen():
+    mt = markdown_table(latency_data[:2]).set_params(row_sep="markdown", quote=False)
+    layout = mt.get_layout()
+    wide_data = latency_data + [{"service": "recommendations", "latency": 7}]
+    mt = markdown_table(wide_data, layout=layout)
+    assert mt.get_markdown() == markdown_table(wide_data).set_params(row_sep="markdown", quote=False).get_markdown()
+    assert mt.get_layout()["widths"] == {"service": 15, "latency": 7}
+    with pytest.raises(ValueError):
+        markdown_table(wide_data, layout=layout, strict_layout=True).get_markdown()
+
+
+def test_layout_multiline_widen():
+    params = {"multiline": {"A": 12, "B": 12, "C": 9}, "multiline_strategy": "rows_and_header", "quote": False}
+    layout = markdown_table(multiline_data).set_params(**params).get_layout()
+    data = multiline_data + [{"A": "row4_A_is_contiguous", "B": "row4_B", "C": "row4_C"}]
+    mt = markdown_table(data, layout=layout)
+    mt.get_markdown()
+    assert mt.get_layout()["widths"]["A"] == len("row4_A_is_contiguous")
+    assert mt.get_layout()["widths"]["B"] == 12
+    with pytest.raises(ValueError):
+        markdown_table(data, layout=layout, strict_layout=True).get_markdown()
+
+
+def test_layout_column_order():
+    layout = markdown_table([{"a": "xxxxxxxx", "b": "y"}]).set_params(quote=False).get_layout()
+    data = [{"b": "y", "a": "xxxxxxxx"}]
+    expected = markdown_table(data).set_params(quote=False).get_markdown()
+    assert markdown_table(data, layout=layout, strict_layout=True).get_markdown() == expected
+
+
+def test_layout_bad_input():
+    layout = markdown_table(latency_data).get_layout()
+    with pytest.raises(ValueError):
+        markdown_table(formatting_data, layout=layout)
+    with pytest.raises(ValueError):
+        markdown_table(latency_data, layout={"widths": layout["widths"]})
+    with pytest.raises(ValueError):
+        markdown_table(latency_data).set_params(numeric_alignment="right").get_layout()
+
+
+@pytest.mark.parametrize("params", [
+    {"row_sep": "always", "padding_width": 2},
+    {"row_sep": "markdown", "numeric_alignment": "decimal", "float_rounding": 1, "max_rows": 2},
+    {"row_sep": "topbottom", "multiline": {"title": 7, "time": 11, "date": 5, "seats": 5, "load": 4}},
+])
+def test_column_pages(params):
+    data = [dict(row, load=f"{i}.25" if "multiline" in params else i * 1.25) for i, row in enumerate(formatting_data)]
+    params = dict(params, quote=False)
+    full = markdown_table(copy.deepcopy(data)).set_params(**params).get_markdown().split("\n")
+    columns = {key: i for i, key in enumerate(data[0].keys())}
+    pages = list(markdown_table(copy.deepcopy(data)).set_params(**params).column_pages(30, repeat_columns=["seats"]))
+    assert len(pages) > 1
+    for page in pages:
+        lines = page.split("\n")
+        assert len(lines) == len(full)
+        header = [cell.strip() for cell in lines[0 if params["row_sep"] == "markdown" else 2].split("|")[1:-1]]
+        assert header[0] == "seats"
+        for i, line in enumerate(lines):
+            assert len(line) <= 30
+            if line.startswith("|") and "more row" not in line:
+                cells = line.split("|")[1:-1]
+                full_cells = full[i].split("|")[1:-1]
+                assert cells == [full_cells[columns[key]] for key in header]
+
+
+def test_column_pages_output_budget():
+    data = [{"name": f"host{i}", "note": "x" * 20, "load": str(i)} for i in range(6)]
+    mt = markdown_table(data).set_params(row_sep="markdown", quote=False, max_output_chars=150)
+    shown = mt.get_markdown().count("host")
+    pages = list(mt.column_pages(30, repeat_columns=["name"]))
+    assert len(pages) == 2
+    for page in pages:
+        assert page.count("host") == shown
+        assert page.endswith(f"{6 - shown} more rows omitted")
+
+
+@pytest.mark.parametrize("max_rows", [0, 2])
+def test_column_pages_omitted_rows(max_rows):
+    data = [{"name": f"host{i}", "note": "x" * 20, "load": i * 1.25} for i in range(1000)]
+    mt = markdown_table(data).set_params(row_sep="markdown", quote=False, max_rows=max_rows, float_rounding=1)
+    pages = list(mt.column_pages(30, repeat_columns=["name"]))
+    assert len(pages) == 2
+    for page in pages:
+        assert page.count("host") == max_rows
+        assert page.endswith(f"{1000 - max_rows} more rows omitted")
+
+
+def test_column_pages_bad_input():
+    mt = markdown_table(formatting_data)
+    with pytest.raises(ValueError):
+        mt.column_pages(0)
+    with pytest.raises(ValueError):
+        mt.column_pages(40, repeat_columns=["unknown"])
+    with pytest.raises(ValueError):
+        mt.set_params(style="gfm-compact").column_pages(40)
+
+
+def test_shared_layout():
+    datasets = [latency_data[:1], latency_data[1:3], latency_data[3:]]
+    params = {"row_sep": "markdown", "padding_width": 1, "quote": False}
+    layout = shared_layout(iter(datasets), **params)
+    combined = markdown_table(latency_data).set_params(**params).get_markdown().split("\n")
+    for data in datasets:
+        lines = markdown_table(data, layout=layout, strict_layout=True).get_markdown().split("\n")
+        assert lines[:2] == combined[:2]
+        assert all(line in combined for line in lines)
+
+
+def test_shared_layout_multiline():
+    params = {"multiline": {"A": 12, "B": 12, "C": 9}, "padding_width": 1, "row_sep": "always"}
+    layout = shared_layout([multiline_data[:1], multiline_data[1:]], **params)
+    for data in [multiline_data[:1], multiline_data[1:]]:
+        expected = markdown_table(data).set_params(**copy.deepcopy(params)).get_markdown()
+        assert markdown_table(data, layout=layout).get_markdown() == expected
+
+
+def test_shared_layout_bad_input():
+    with pytest.raises(ValueError):
+        shared_layout([])
+    with pytest.raises(ValueError):
+        shared_layout([latency_data, formatting_data])
+    for params in [{"fit_width": 40}, {"sort_by": "latency", "limit": 1}, {"max_rows": 1}, {"budget_widths": "shown"}]:
+        with pytest.raises(ValueError):
+            shared_layout([latency_data], **params)
+
+
+def test_shared_layout_column_order():
+    first = [{"host": "a-long-hostname", "v": "1"}]
+    second = [{"v": "22", "host": "b"}]
+    layout = shared_layout([first, second], row_sep="markdown", quote=False)
+    assert markdown_table(second, layout=layout, strict_layout=True).get_markdown() == (
+        "| v|      host     |\n|--|---------------|\n|22|       b       |"
+    )
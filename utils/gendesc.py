@@ -125,12 +125,102 @@ params = [
         "values": "",
         "description": "Character that will be used to split a cell's contents into multiple rows. The default value is a blank space ` `.",
     },
+    {
+        "param": "fit_width",
+        "type": "int",
+        "values": "",
+        "description": "Renders the table as `multiline` with column widths chosen automatically to fit within `fit_width` characters while minimizing the number of rendered lines. Columns are never narrower than their longest contiguous string. Default is `None`.",
+    },
     {
         "param": "quote",
         "type": "bool",
         "values": "",
         "description": "Wraps the generated markdown table in block quotes ```table```. Default is `True`.",
     },
+    {
+        "param": "max_rows",
+        "type": "int",
+        "values": "",
+        "description": "Maximum number of rows rendered by `get_markdown()`. Omitted rows are summarized in a footer. Default is `None`.",
+    },
+    {
+        "param": "max_output_chars",
+        "type": "int",
+        "values": "",
+        "description": "Maximum number of characters returned by `get_markdown()`. Rendering stops before the first row exceeding the budget and the table is closed with a footer. Default is `None`.",
+    },
+    {
+        "param": "budget_widths",
+        "type": "str",
+        "values": "",
+        "description": "Rows used to compute column widths when `max_rows` or `max_output_chars` is set. Possible values are `all` or `shown`. The default value is `all`.",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "all",
+        "description": "Widths are computed from all rows",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "shown",
+        "description": "Widths are computed only from the rendered rows",
+    },
+    {
+        "param": "style",
+        "type": "str",
+        "values": "",
+        "description": "Output style of the table. Possible values are `padded` or `gfm-compact`. The default value is `padded`.",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "padded",
+        "description": "Renders padded and aligned columns",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "gfm-compact",
+        "description": "Renders an unpadded GitHub-flavored pipe table with alignment markers derived from `padding_weight`. No column widths are computed, `row_sep` and `quote` are ignored",
+    },
+    {
+        "param": "numeric_alignment",
+        "type": "str",
+        "values": "",
+        "description": "Renders columns containing only numbers through a fast path formatting the whole column at once. Floats use a fixed precision of `float_rounding` digits when set. Not supported by `multiline` tables and the `gfm-compact` style. Default is `None`.",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "right",
+        "description": "Aligns the numbers to the end of the cell",
+    },
+    {
+        "param": "",
+        "type": "",
+        "values": "decimal",
+        "description": "Aligns the numbers on their decimal point",
+    },
+    {
+        "param": "sort_by",
+        "type": "str",
+        "values": "",
+        "description": "Column by which the rows are ordered before rendering, with missing values (`None`) last. Default is `None`.",
+    },
+    {
+        "param": "sort_order",
+        "type": "str",
+        "values": "",
+        "description": "Order applied when `sort_by` is set. Possible values are `descending` or `ascending`. The default value is `descending`.",
+    },
+    {
+        "param": "limit",
+        "type": "int",
+        "values": "",
+        "description": "Number of rows selected for rendering. Combined with `sort_by` renders the top-N rows using a partial heap sort. Column widths are computed only from the selected rows. Default is `None`.",
+    },
 ]
 
 